@@ -16,6 +16,15 @@ def benchmark_isqlite():
         db.select("counter", where="n > 1000")
 
 
+def benchmark_isqlite_many():
+    with Database(":memory:") as db:
+        db.create_table("counter", ["n INTEGER NOT NULL"])
+
+        db.insert_many("counter", [{"n": n} for n in range(100000)])
+
+        db.select("counter", where="n > 1000")
+
+
 def benchmark_sqlite3():
     with sqlite3.connect(":memory:") as conn:
         conn.execute("CREATE TABLE counter(n INTEGER NOT NULL)")
@@ -26,6 +35,17 @@ def benchmark_sqlite3():
         conn.execute("SELECT * FROM counter WHERE n > 1000")
 
 
+def benchmark_sqlite3_many():
+    with sqlite3.connect(":memory:") as conn:
+        conn.execute("CREATE TABLE counter(n INTEGER NOT NULL)")
+
+        conn.executemany(
+            "INSERT INTO counter(n) VALUES (?)", ((n,) for n in range(100000))
+        )
+
+        conn.execute("SELECT * FROM counter WHERE n > 1000")
+
+
 def benchmark():
     sqlite3_results = timeit.timeit(
         "benchmark_sqlite3()", number=1, setup="from __main__ import benchmark_sqlite3"
@@ -37,6 +57,20 @@ def benchmark():
     )
     print(f"isqlite: {isqlite_results:0.3f} seconds")
 
+    sqlite3_many_results = timeit.timeit(
+        "benchmark_sqlite3_many()",
+        number=1,
+        setup="from __main__ import benchmark_sqlite3_many",
+    )
+    print(f"sqlite3 (executemany): {sqlite3_many_results:0.3f} seconds")
+
+    isqlite_many_results = timeit.timeit(
+        "benchmark_isqlite_many()",
+        number=1,
+        setup="from __main__ import benchmark_isqlite_many",
+    )
+    print(f"isqlite (insert_many): {isqlite_many_results:0.3f} seconds")
+
 
 def profile():
     cProfile.run("benchmark_isqlite()", sort="cumulative")
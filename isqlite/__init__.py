@@ -1,5 +1,6 @@
 import datetime
 import decimal
+import re
 import sqlite3
 import warnings
 
@@ -27,14 +28,26 @@ def sqlite3_convert_boolean(b):
 
 
 def sqlite3_convert_decimal(b):
-    return decimal.Decimal(b.decode("utf8"))
+    return decimal.Decimal(b.decode("ascii"))
 
 
 def sqlite3_adapt_decimal(d):
     return str(d)
 
 
+_TIME_PATTERN = re.compile(rb"[0-9]{2}:[0-9]{2}:[0-9]{2}\Z")
+
+
 def sqlite3_convert_time(b):
+    # Fast path for the canonical HH:MM:SS format: read the digits directly out of
+    # the bytes instead of decoding and splitting the string.
+    if _TIME_PATTERN.match(b):
+        return datetime.time(
+            (b[0] - 48) * 10 + (b[1] - 48),
+            (b[3] - 48) * 10 + (b[4] - 48),
+            (b[6] - 48) * 10 + (b[7] - 48),
+        )
+
     parts = b.decode("utf8").split(":", maxsplit=2)
     if len(parts) == 3:
         hour = int(parts[0])
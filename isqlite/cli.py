@@ -1,20 +1,23 @@
 """
 The implementation of the `isqlite` command-line tool.
 """
+# Some modules (notably `tabulate`) are imported inside the functions that use them
+# instead of here, since they are only needed by a few subcommands and importing them
+# makes up a large part of the tool's startup time.
 import collections
-import importlib
-import shutil
+import itertools
+import json
+import re
+import shlex
 import sqlite3
 import sys
-import tempfile
-import traceback
 
 import click
 import sqliteparser
-from tabulate import tabulate
 
 from . import Database as ISqliteDatabase
 from . import Schema, migrations
+from .database import get_foreign_key_model, is_foreign_key_column
 
 # Help strings used in multiple places.
 HELP_AUTO_TIMESTAMP_CREATE = (
@@ -44,6 +47,22 @@ HELP_PLAIN_FOREIGN_KEYS = (
     + "TEXT column of the foreign key table. Pass this flag if you would rather just "
     + "see the foreign key values themselves."
 )
+HELP_TSV = (
+    "Print the results as tab-separated values instead of as a table. Tabs, newlines "
+    + "and backslashes in values are escaped with backslashes."
+)
+HELP_JSON = (
+    "Print each row as a JSON object on its own line instead of as a table. Foreign "
+    + "keys are printed as nested objects unless --plain-foreign-keys is passed. If "
+    + "the WHERE clause has a column name that is ambiguous once the foreign keys are "
+    + "joined, it is an error."
+)
+
+
+ROWID_ALIASES = ["rowid", "oid", "_rowid_"]
+STRING_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+UNQUALIFIED_IDENTIFIER_PATTERN = re.compile(r"(?<![\w.])([A-Za-z_]\w*)(?![\w.])")
+TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
 
 
 def Database(*args, **kwargs):
@@ -136,13 +155,7 @@ def main_insert(db_path, table, payload, *, auto_timestamp=True):
 
 
 def _create(db_path, table, payload, *, auto_timestamp):
-    if not payload:
-        report_error_and_exit("payload must not be empty")
-
-    payload_as_map = {}
-    for key_value in payload:
-        key, value = key_value.split("=", maxsplit=1)
-        payload_as_map[key] = value
+    payload_as_map = parse_payload(payload)
 
     if auto_timestamp:
         auto_timestamp_columns = ["created_at", "last_updated_at"]
@@ -156,6 +169,47 @@ def _create(db_path, table, payload, *, auto_timestamp):
         print(f"Row {pk} created.")
 
 
+@cli.command(name="create-many")
+@click.argument("db_path")
+@click.argument("table")
+@click.option(
+    "--auto-timestamp/--no-auto-timestamp",
+    default=True,
+    help=HELP_AUTO_TIMESTAMP_CREATE,
+)
+def main_create_many(db_path, table, *, auto_timestamp=True):
+    """
+    Create many rows from standard input in a single transaction.
+
+    Each line of standard input should be a list of space-separated key-value pairs,
+    in the same format as the payload of 'create', e.g.
+
+        printf 'a=1 b=2\\na=3 b="x y"\\n' | isqlite create-many db.sqlite3 books
+    """
+    created = 0
+
+    def parse_payloads():
+        nonlocal created
+        for words in read_payload_lines():
+            created += 1
+            yield parse_payload(words)
+
+    if auto_timestamp:
+        auto_timestamp_columns = ["created_at", "last_updated_at"]
+    else:
+        auto_timestamp_columns = []
+
+    # The input is parsed as it is inserted, so it is never all held in memory. If a
+    # line is invalid, exiting inside the `with` block rolls back the transaction.
+    with Database(db_path) as db:
+        # `Database.insert_many` requires every row to have the same columns, so
+        # consecutive rows with the same columns are inserted together.
+        for _, rows in itertools.groupby(parse_payloads(), key=lambda row: tuple(row)):
+            db.insert_many(table, rows, auto_timestamp_columns=auto_timestamp_columns)
+
+        print(f"{pluralize(created, 'row')} created.")
+
+
 @cli.command(name="create-table")
 @click.argument("db_path")
 @click.argument("table")
@@ -191,10 +245,7 @@ def main_delete(db_path, table, pk, *, where, no_confirm):
                 print(f"Row {pk} not found in table {table!r}.")
                 sys.exit(1)
 
-            for key, value in row.items():
-                if isinstance(value, collections.OrderedDict):
-                    row[key] = get_column_as_string(value)
-
+            render_foreign_keys(row, get_related_columns(db, table))
             prettyprint_row(row)
 
             if not no_confirm:
@@ -225,7 +276,7 @@ def main_delete(db_path, table, pk, *, where, no_confirm):
             if not where:
                 where = "1"
 
-            db.delete(table, where=where)
+            n = db.delete(table, where=where)
             print()
             print(f"{pluralize(n, 'row')} from table {table!r} deleted.")
 
@@ -258,15 +309,15 @@ def _diff(db, schema, table, *, detect_renaming=True):
     tables_created = 0
     tables_dropped = 0
     columns_dropped = 0
-    printed = False
+    # The diff can be long for large schemas, so it is printed in one go rather than
+    # line by line.
+    lines = []
     grouped_diff = group_diff_by_table(diff)
     for table, table_diff in sorted(grouped_diff.items(), key=lambda kv: kv[0]):
-        if printed:
-            print()
-        else:
-            printed = True
+        if lines:
+            lines.append("")
 
-        print(f"Table {blue(table)}")
+        lines.append(f"Table {blue(table)}")
         for op in table_diff:
             if isinstance(op, migrations.DropColumnMigration):
                 columns_dropped += 1
@@ -275,8 +326,9 @@ def _diff(db, schema, table, *, detect_renaming=True):
             elif isinstance(op, migrations.CreateTableMigration):
                 tables_created += 1
 
-            print(f"- {op}")
+            lines.append(f"- {op}")
 
+    print("\n".join(lines))
     print()
     print()
     print("Summary")
@@ -306,10 +358,9 @@ def main_drop_column(db_path, table, column, *, no_confirm):
     """
     Drop a column from a table.
     """
-    if not no_confirm:
-        with Database(db_path) as db:
+    with Database(db_path) as db:
+        if not no_confirm:
             count = db.count(table)
-
             print(
                 f"WARNING: Table {table!r} contains {pluralize(count, 'row')} of data."
             )
@@ -319,7 +370,6 @@ def main_drop_column(db_path, table, column, *, no_confirm):
                 print("Operation aborted.")
                 sys.exit(1)
 
-    with Database(db_path) as db:
         db.drop_column(table, column)
         print()
         print(f"Column {column!r} dropped from table {table!r}.")
@@ -362,7 +412,8 @@ def main_drop_table(db_path, table, *, no_confirm):
 @click.option(
     "--plain-foreign-keys", is_flag=True, default=False, help=HELP_PLAIN_FOREIGN_KEYS
 )
-def main_get(db_path, table, pk, *, plain_foreign_keys):
+@click.option("--json", "as_json", is_flag=True, default=False, help=HELP_JSON)
+def main_get(db_path, table, pk, *, plain_foreign_keys, as_json):
     """
     Fetch a single row.
     """
@@ -371,12 +422,13 @@ def main_get(db_path, table, pk, *, plain_foreign_keys):
         if row is None:
             report_error_and_exit(f"row {pk} not found in table {table!r}.")
 
-        if not plain_foreign_keys:
-            for key, value in row.items():
-                if isinstance(value, collections.OrderedDict):
-                    row[key] = get_column_as_string(value)
+        if as_json:
+            print(row_to_json(row))
+        else:
+            if not plain_foreign_keys:
+                render_foreign_keys(row, get_related_columns(db, table))
 
-        prettyprint_row(row)
+            prettyprint_row(row)
 
 
 @cli.command(name="icreate")
@@ -507,6 +559,8 @@ def _prompt_for_table(db, table, row, *, auto_timestamp):
 @click.option(
     "--plain-foreign-keys", is_flag=True, default=False, help=HELP_PLAIN_FOREIGN_KEYS
 )
+@click.option("--tsv", is_flag=True, default=False, help=HELP_TSV)
+@click.option("--json", "as_json", is_flag=True, default=False, help=HELP_JSON)
 def main_list(
     db_path,
     table,
@@ -521,6 +575,8 @@ def main_list(
     order_by,
     desc,
     plain_foreign_keys,
+    tsv,
+    as_json,
 ):
     """
     List the rows in the table, optionally filtered by a SQL clause.
@@ -538,6 +594,8 @@ def main_list(
         order_by=order_by,
         desc=desc,
         plain_foreign_keys=plain_foreign_keys,
+        tsv=tsv,
+        as_json=as_json,
     )
 
 
@@ -556,6 +614,8 @@ def main_list(
 @click.option(
     "--plain-foreign-keys", is_flag=True, default=False, help=HELP_PLAIN_FOREIGN_KEYS
 )
+@click.option("--tsv", is_flag=True, default=False, help=HELP_TSV)
+@click.option("--json", "as_json", is_flag=True, default=False, help=HELP_JSON)
 def main_select(
     db_path,
     table,
@@ -570,6 +630,8 @@ def main_select(
     order_by,
     desc,
     plain_foreign_keys,
+    tsv,
+    as_json,
 ):
     """
     Alias for 'list'.
@@ -587,6 +649,8 @@ def main_select(
         order_by=order_by,
         desc=desc,
         plain_foreign_keys=plain_foreign_keys,
+        tsv=tsv,
+        as_json=as_json,
     )
 
 
@@ -604,26 +668,53 @@ def _select(
     order_by,
     desc,
     plain_foreign_keys,
+    tsv,
+    as_json,
 ):
     """
     Base implementation shared by `main_list`, `main_search`, and `main_select`.
     """
+    if tsv and as_json:
+        report_error_and_exit("--tsv and --json cannot be used together.")
+
+    # With --json, foreign keys are printed as nested objects, which requires
+    # `get_related`. Silently falling back to plain foreign keys would change the shape
+    # of the output depending on the WHERE clause, so it is an error instead.
+    json_ambiguous_error = (
+        "the WHERE clause has a column name that is ambiguous when foreign keys are "
+        + "fetched. Qualify it with its table name (e.g., "
+        + f"{table}.rowid instead of rowid), or pass --plain-foreign-keys."
+    )
+
     with Database(db_path, readonly=True) as db:
+        # Because `get_related` uses SQL joins, it causes 'ambiguous column' errors if
+        # the user-supplied WHERE clause has unqualified column names that are shared by
+        # the joined tables, so we don't use it in that case.
+        ambiguous = not plain_foreign_keys and has_ambiguous_columns(db, table, where)
+        if ambiguous and as_json:
+            report_error_and_exit(json_ambiguous_error)
+
+        get_related = not plain_foreign_keys and not ambiguous
         try:
-            rows = db.select(
+            rows = db.iter_select(
                 table,
                 where=where,
                 order_by=order_by,
                 limit=limit,
                 offset=offset,
                 descending=desc if order_by else None,
-                get_related=not plain_foreign_keys,
+                get_related=get_related,
             )
         except sqlite3.OperationalError:
-            # Because `get_related` uses SQL joins, it may cause 'ambiguous column'
-            # errors if the user-supplied WHERE clause has unqualified column names. So
-            # we simply retry on error with `get_related=False`.
-            rows = db.select(
+            # `has_ambiguous_columns` is only a heuristic, so if the query fails anyway
+            # we retry with `get_related=False`.
+            if not get_related:
+                raise
+            elif as_json:
+                report_error_and_exit(json_ambiguous_error)
+
+            get_related = False
+            rows = db.iter_select(
                 table,
                 where=where,
                 order_by=order_by,
@@ -633,33 +724,37 @@ def _select(
                 get_related=False,
             )
 
-        if not plain_foreign_keys:
-            for row in rows:
-                for key, value in row.items():
-                    if isinstance(value, collections.OrderedDict):
-                        row[key] = get_column_as_string(value)
+        # Rows are transformed and filtered as they are fetched, so that rows which
+        # don't match the search query are never held in memory.
+        if get_related:
+            related_columns = get_related_columns(db, table)
+            if not as_json:
+                rows = (render_foreign_keys(row, related_columns) for row in rows)
 
         if search:
-            search = search.lower()
-            filtered_rows = []
-            for row in rows:
-                yes = False
-                for value in row.values():
-                    if isinstance(value, str) and search in value.lower():
-                        yes = True
-                    elif isinstance(value, collections.OrderedDict):
-                        for subvalue in value.values():
-                            if isinstance(subvalue, str) and search in subvalue.lower():
-                                yes = True
-                                break
-
-                    if yes:
-                        break
-
-                if yes:
-                    filtered_rows.append(row)
-            rows = filtered_rows
+            folded_search = search.casefold()
+            if get_related and as_json:
+                # --json prints related rows as nested objects, but the search query is
+                # matched against the same rendered text that the other formats show, so
+                # that every format finds the same rows.
+                rows = (
+                    row
+                    for row in rows
+                    if row_matches_search(
+                        render_foreign_keys(row.copy(), related_columns), folded_search
+                    )
+                )
+            else:
+                rows = (row for row in rows if row_matches_search(row, folded_search))
 
+        if tsv:
+            print_rows_as_tsv(rows, columns=columns, hide=hide)
+            return
+        elif as_json:
+            print_rows_as_json(rows, columns=columns, hide=hide)
+            return
+
+        rows = list(rows)
         if not rows:
             if search:
                 print(
@@ -708,6 +803,10 @@ def main_migrate(
     """
     Migrate the database to match the Python schema.
     """
+    import shutil
+    import tempfile
+    import traceback
+
     schema = get_schema_from_path(schema_path)
     with Database(db_path, transaction=False, debug=debug) as db:
         diff, data_dropped = _diff(db, schema, table, detect_renaming=not no_rename)
@@ -799,41 +898,25 @@ def main_schema(db_path, table, *, as_python):
     """
     List the names of the tables in the database.
     """
+    # The database's schema is already read and parsed when it is opened, so there is
+    # no need to query `sqlite_master` or parse the SQL again here.
     with Database(db_path, readonly=True) as db:
         if table is not None:
-            row = db.get(
-                "sqlite_master",
-                where="type = 'table' AND name = :table",
-                values={"table": table},
-            )
-            if row is None:
+            if table not in db.schema:
                 report_error_and_exit(f"table {table!r} not found.")
 
-            sql = row["sql"]
-
             if as_python:
                 raise NotImplementedError
             else:
-                try:
-                    # Use sqliteparser to parse and pretty-print the table schema.
-                    create_table_statement = sqliteparser.parse(sql)[0]
-                    print(create_table_statement)
-                except sqliteparser.SQLiteParserError:
-                    # If sqliteparser can't parse the table schema, just directly print
-                    # what SQLite returned to us.
-                    print(sql)
+                print(db.schema[table])
         else:
             if as_python:
                 raise NotImplementedError
             else:
-                rows = db.select(
-                    "sqlite_master",
-                    where="type = 'table' AND name NOT LIKE 'sqlite_%'",
-                    order_by="name",
-                )
+                table_names = sorted(db.schema.table_names)
 
-            if rows:
-                print("\n".join(row["name"] for row in rows))
+            if table_names:
+                print("\n".join(table_names))
 
 
 @cli.command(name="search")
@@ -851,6 +934,8 @@ def main_schema(db_path, table, *, as_python):
 @click.option(
     "--plain-foreign-keys", is_flag=True, default=False, help=HELP_PLAIN_FOREIGN_KEYS
 )
+@click.option("--tsv", is_flag=True, default=False, help=HELP_TSV)
+@click.option("--json", "as_json", is_flag=True, default=False, help=HELP_JSON)
 def main_search(
     db_path,
     table,
@@ -865,6 +950,8 @@ def main_search(
     order_by,
     desc,
     plain_foreign_keys,
+    tsv,
+    as_json,
 ):
     """
     Alias for 'list <table> -s <query>'.
@@ -882,6 +969,8 @@ def main_search(
         order_by=order_by,
         desc=desc,
         plain_foreign_keys=plain_foreign_keys,
+        tsv=tsv,
+        as_json=as_json,
     )
 
 
@@ -897,10 +986,15 @@ def main_search(
     default=False,
     help="Allow writing to the database. False by default.",
 )
-def main_sql(db_path, query, *, columns, hide, page, write):
+@click.option("--tsv", is_flag=True, default=False, help=HELP_TSV)
+@click.option("--json", "as_json", is_flag=True, default=False, help=HELP_JSON)
+def main_sql(db_path, query, *, columns, hide, page, write, tsv, as_json):
     """
     Run a SQL command.
     """
+    if tsv and as_json:
+        report_error_and_exit("--tsv and --json cannot be used together.")
+
     readonly = not write
     with Database(db_path, readonly=readonly) as db:
         try:
@@ -913,7 +1007,11 @@ def main_sql(db_path, query, *, columns, hide, page, write):
 
             raise e
 
-        if rows:
+        if tsv:
+            print_rows_as_tsv(rows, columns=columns, hide=hide)
+        elif as_json:
+            print_rows_as_json(rows, columns=columns, hide=hide)
+        elif rows:
             prettyprint_rows(rows, columns=columns, hide=hide, page=page)
 
         # Don't print a message if there are no rows, because some SQL queries (e.g.,
@@ -941,17 +1039,7 @@ def main_update(db_path, table, pk, payload, *, auto_timestamp):
 
     To set a column null, use the special NULL value.
     """
-    if not payload:
-        report_error_and_exit("payload must not be empty")
-
-    payload_as_map = {}
-    for key_value in payload:
-        key, value = key_value.split("=", maxsplit=1)
-
-        if value == "NULL":
-            value = None
-
-        payload_as_map[key] = value
+    payload_as_map = parse_payload(payload, allow_null=True)
 
     if auto_timestamp:
         auto_timestamp_columns = ["last_updated_at"]
@@ -968,28 +1056,82 @@ def main_update(db_path, table, pk, payload, *, auto_timestamp):
             report_error_and_exit(f"row {pk} not found in table {table!r}.")
 
 
+@cli.command(name="update-many")
+@click.argument("db_path")
+@click.argument("table")
+@click.option(
+    "--auto-timestamp/--no-auto-timestamp",
+    default=True,
+    help=HELP_AUTO_TIMESTAMP_UPDATE,
+)
+def main_update_many(db_path, table, *, auto_timestamp):
+    """
+    Update many rows from standard input in a single transaction.
+
+    Each line of standard input should be a primary key followed by a list of
+    space-separated key-value pairs, in the same format as the arguments of 'update',
+    e.g.
+
+        printf '1 a=1 b=2\\n2 a=NULL\\n' | isqlite update-many db.sqlite3 books
+    """
+
+    def parse_updates():
+        for pk, *payload in read_payload_lines():
+            try:
+                pk = int(pk)
+            except ValueError:
+                report_error_and_exit(f"primary key must be an integer, not {pk!r}")
+
+            yield pk, parse_payload(payload, allow_null=True)
+
+    if auto_timestamp:
+        auto_timestamp_columns = ["last_updated_at"]
+    else:
+        auto_timestamp_columns = []
+
+    # As in `main_create_many`, the input is parsed as it is written.
+    with Database(db_path) as db:
+        updated = 0
+        # `Database.update_many_by_pks` requires every row to have the same columns,
+        # so consecutive rows with the same columns are updated together.
+        updates = parse_updates()
+        for _, pairs in itertools.groupby(updates, key=lambda pair: tuple(pair[1])):
+            updated += db.update_many_by_pks(
+                table, pairs, auto_timestamp_columns=auto_timestamp_columns
+            )
+
+        print(f"{pluralize(updated, 'row')} updated.")
+
+
 def prettyprint_rows(rows, *, columns=[], hide=[], page=1):
+    import shutil
+
+    from tabulate import tabulate
+
+    # Every row has the same keys, so the visible columns only need to be chosen once.
     headers = [key for key in rows[0].keys() if should_show_column(key, columns, hide)]
-    table_rows = [
-        [cell for key, cell in row.items() if should_show_column(key, columns, hide)]
-        for row in rows
-    ]
+    table_rows = [[row[key] for key in headers] for row in rows]
     table = tabulate(table_rows, headers=headers)
 
     overflow = False
     width = shutil.get_terminal_size().columns
     placeholder = " ..."
+    start = width * (page - 1)
+    end = start + width - len(placeholder)
+    # The lines are collected and printed all at once, rather than calling `print` for
+    # each one, since output to a terminal is flushed on every newline.
+    lines = []
     for line in table.splitlines():
         if len(line) > width:
-            start = width * (page - 1)
-            end = start + width - len(placeholder)
             if end < len(line):
-                print(line[start:end] + placeholder)
+                lines.append(line[start:end] + placeholder)
                 overflow = True
             else:
-                print(line[start:end])
+                lines.append(line[start:end])
         else:
-            print(line)
+            lines.append(line)
+
+    print("\n".join(lines))
 
     if table_rows:
         print()
@@ -1008,10 +1150,51 @@ def prettyprint_rows(rows, *, columns=[], hide=[], page=1):
 
 
 def prettyprint_row(row):
+    from tabulate import tabulate
+
     table = list(row.items())
     print(tabulate(table))
 
 
+def print_rows_as_tsv(rows, *, columns=[], hide=[]):
+    # Unlike `prettyprint_rows`, this doesn't need to see every row to compute column
+    # widths, so rows are written out as they are read.
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if first_row is None:
+        return
+
+    keys = [key for key in first_row.keys() if should_show_column(key, columns, hide)]
+    write = sys.stdout.write
+    write("\t".join(map(tsv_escape, keys)) + "\n")
+    for row in itertools.chain((first_row,), rows):
+        write("\t".join([tsv_escape(row[key]) for key in keys]) + "\n")
+
+
+def print_rows_as_json(rows, *, columns=[], hide=[]):
+    rows = iter(rows)
+    first_row = next(rows, None)
+    if first_row is None:
+        return
+
+    keys = [key for key in first_row.keys() if should_show_column(key, columns, hide)]
+    write = sys.stdout.write
+    for row in itertools.chain((first_row,), rows):
+        write(row_to_json({key: row[key] for key in keys}) + "\n")
+
+
+def row_to_json(row):
+    # Values that JSON has no type for, e.g. dates and decimals, are printed as strings.
+    return json.dumps(row, default=str)
+
+
+def tsv_escape(value):
+    if value is None:
+        return ""
+
+    return str(value).translate(TSV_ESCAPES)
+
+
 def should_show_column(key, columns, hide):
     if columns:
         return key in columns
@@ -1022,16 +1205,80 @@ def should_show_column(key, columns, hide):
     return True
 
 
+def get_related_columns(db, table):
+    """
+    Return the columns of `table` that are fetched as related rows when
+    `get_related=True` is passed to `Database.select`.
+    """
+    return [
+        column
+        for column in db.schema[table].columns
+        if is_foreign_key_column(column) and get_foreign_key_model(column) != table
+    ]
+
+
+def has_ambiguous_columns(db, table, where):
+    """
+    Return whether the WHERE clause might refer, without qualifying it with a table
+    name, to a column that appears in more than one of the tables that are joined when
+    `get_related=True` is passed to `Database.select`.
+    """
+    if not where:
+        return False
+
+    tables = [table] + [
+        get_foreign_key_model(column) for column in get_related_columns(db, table)
+    ]
+    if len(tables) == 1:
+        return False
+
+    # Every table has an implicit `rowid` column.
+    counts = collections.Counter(ROWID_ALIASES * len(tables))
+    for t in tables:
+        counts.update(column.name.lower() for column in db.schema[t].columns)
+
+    # String literals can't refer to columns, so they are removed before looking for
+    # identifiers that aren't preceded or followed by a dot.
+    where = STRING_LITERAL_PATTERN.sub("", where)
+    return any(
+        counts[identifier.lower()] > 1
+        for identifier in UNQUALIFIED_IDENTIFIER_PATTERN.findall(where)
+    )
+
+
+def render_foreign_keys(row, related_columns):
+    # Only the foreign-key columns can hold related rows, so there is no need to check
+    # the type of every cell in the row.
+    for column in related_columns:
+        value = row[column.name]
+        if value is not None:
+            row[column.name] = get_column_as_string(value)
+
+    return row
+
+
+def row_matches_search(row, search):
+    # `search` should already be case-folded, and related rows should already have been
+    # rendered with `render_foreign_keys`.
+    return any(
+        isinstance(value, str) and search in value.casefold() for value in row.values()
+    )
+
+
 def get_column_as_string(column):
     pk = None
     text = None
 
     # Pretty rudimentary logic: assume the first integer value is the row's primary key
     # and the first string value is a reasonable choice for displaying the row.
+    #
+    # Exact type checks are used so that boolean columns, whose values are a subclass of
+    # `int`, are not mistaken for the primary key.
     for value in column.values():
-        if isinstance(value, int) and pk is None:
+        value_type = type(value)
+        if value_type is int and pk is None:
             pk = value
-        elif isinstance(value, str) and text is None:
+        elif value_type is str and text is None:
             text = value
 
         if pk is not None and text is not None:
@@ -1049,7 +1296,44 @@ def get_column_as_string(column):
             return "<foreign row>"
 
 
+def parse_payload(payload, *, allow_null=False):
+    if not payload:
+        report_error_and_exit("payload must not be empty")
+
+    payload_as_map = {}
+    for key_value in payload:
+        key, equals, value = key_value.partition("=")
+        if not equals:
+            report_error_and_exit(
+                f"expected a key-value pair of the form KEY=VALUE, not {key_value!r}"
+            )
+
+        if allow_null and value == "NULL":
+            value = None
+
+        payload_as_map[key] = value
+
+    return payload_as_map
+
+
+def read_payload_lines():
+    """
+    Read the lines of standard input for `create-many` and `update-many`, each split
+    into words with shell quoting rules. Blank lines are skipped.
+    """
+    for i, line in enumerate(sys.stdin, start=1):
+        try:
+            words = shlex.split(line)
+        except ValueError as e:
+            report_error_and_exit(f"could not parse line {i} of input: {e}")
+
+        if words:
+            yield words
+
+
 def get_schema_from_path(schema_path):
+    import importlib.util
+
     if schema_path is None:
         return None
 
@@ -13,8 +13,12 @@ def _base(
     unique: bool = False,
     constraints=[],
 ) -> ast.Column:
+    # Copy `constraints` so that the constraints appended below do not leak into the
+    # shared default list.
     if required:
         constraints = [_not_null_constraint()] + constraints
+    else:
+        constraints = list(constraints)
 
     if choices:
         constraints.append(_choices_constraint(name, choices, required=required))
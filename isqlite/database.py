@@ -1,11 +1,25 @@
 import collections
+import functools
+import itertools
+import operator
 import sqlite3
 import textwrap
+import time
 import warnings
-from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import sqliteparser
-from sqliteparser import quote
 
 from . import migrations
 from .exceptions import (
@@ -21,6 +35,10 @@ CURRENT_EPOCH_TIMESTAMP_SQL = "STRFTIME('%s', 'now')"
 AUTO_TIMESTAMP_DEFAULT = ("created_at", "last_updated_at")
 AUTO_TIMESTAMP_UPDATE_DEFAULT = ("last_updated_at",)
 
+# Identifiers are quoted for every generated query, almost always with the same small
+# set of table and column names, so the results are memoized.
+quote = functools.lru_cache(maxsize=1024)(sqliteparser.quote)
+
 
 # Type aliases
 Row = Dict[str, Any]
@@ -64,11 +82,14 @@ class Database:
         debug: bool = False,
         readonly: Optional[bool] = None,
         uri: bool = False,
-        cached_statements: int = 100,
+        cached_statements: int = 128,
         enforce_foreign_keys: bool = True,
         insert_auto_timestamp_columns: List[str] = [],
         update_auto_timestamp_columns: List[str] = [],
         use_epoch_timestamps: bool = False,
+        journal_mode: Optional[str] = None,
+        synchronous: Optional[str] = None,
+        pragmas: Dict[str, Any] = {},
     ) -> None:
         """
         Initialize a ``Database`` object.
@@ -99,7 +120,9 @@ class Database:
             append ``?mode=ro`` to make it read-only. Defaults to false.
         :param uri: If true, the ``path`` argument is interpreted as a URI rather than a
             file path.
-        :param cached_statements: Passed on to ``sqlite3.connect``.
+        :param cached_statements: Passed on to ``sqlite3.connect``, and also the size of
+            isqlite's own caches of generated SQL. The default matches that of the
+            ``sqlite3`` module.
         :param enforce_foreign_keys: If true, foreign-key constraint enforcement will be
             turned out with ``PRAGMA foreign_keys = 1``.
         :param insert_auto_timestamp_columns: A default value for
@@ -115,6 +138,23 @@ class Database:
         :param use_epoch_timestamps: Store ``auto_timestamp_columns`` as seconds since
             the Unix epoch instead of as ISO 8601 datetime strings. Recommended setting
             is ``True``, but default is ``False`` for backwards compatibility.
+        :param journal_mode: If not None, set SQLite's journal mode with
+            ``PRAGMA journal_mode``. ``"WAL"`` is recommended for databases that are
+            written to frequently or read concurrently by multiple processes, as readers
+            and writers do not block each other. Note that the journal mode is stored
+            persistently in the database file. Ignored if ``readonly`` is true.
+        :param synchronous: If not None, set ``PRAGMA synchronous``. ``"NORMAL"`` is
+            safe in combination with ``journal_mode="WAL"`` and syncs to disk much less
+            often than SQLite's default of ``"FULL"``. Ignored if ``readonly`` is true.
+        :param pragmas: A dictionary of SQLite pragmas to set when the connection is
+            opened, e.g. ``{"cache_size": -64000, "temp_store": "MEMORY"}``. They are
+            applied before the initial transaction is opened. WARNING: The names and
+            values are directly interpolated into ``PRAGMA`` statements. Do not pass
+            untrusted input.
+
+            Pragmas like ``synchronous = OFF`` can speed up bulk writes considerably,
+            at the cost of durability if the machine crashes or loses power. See
+            https://sqlite.org/pragma.html for details.
         """
         # Validate arguments.
         if readonly is not None:
@@ -139,6 +179,7 @@ class Database:
 
         self.insert_auto_timestamp_columns = insert_auto_timestamp_columns
         self.update_auto_timestamp_columns = update_auto_timestamp_columns
+        self.use_epoch_timestamps = use_epoch_timestamps
         self.current_timestamp_sql = (
             CURRENT_EPOCH_TIMESTAMP_SQL
             if use_epoch_timestamps
@@ -156,15 +197,38 @@ class Database:
         )
 
         self.debugger = Debugger() if debug else None
+        # Generated INSERT and UPDATE statements, keyed by table, columns, and timestamp
+        # columns (and the WHERE clause, for UPDATE). Reusing the identical SQL string
+        # saves rebuilding it on every call and keeps the `sqlite3` module's own
+        # statement cache hitting.
+        self._insert_sql_cache = LRUCache(cached_statements)
+        self._update_sql_cache = LRUCache(cached_statements)
+        # Primary-key lookups and deletions, keyed by table.
+        self._pk_sql_cache = LRUCache(cached_statements)
 
         self.connection.row_factory = ordered_dict_row_factory
         self.cursor = self.connection.cursor()
+        # Queries with `as_tuple=True` run on a separate cursor without a row factory,
+        # so that SQLite's rows are returned as-is instead of being converted into
+        # `OrderedDict` objects only to be converted back into tuples.
+        self._tuple_cursor = self.connection.cursor()
+        self._tuple_cursor.row_factory = None
 
         if enforce_foreign_keys:
             # This must be executed outside a transaction, according to the official
             # SQLite docs: https://sqlite.org/pragma.html#pragma_foreign_keys
             self.sql("PRAGMA foreign_keys = 1")
 
+        if not readonly:
+            if journal_mode is not None:
+                self._execute(f"PRAGMA journal_mode = {journal_mode}")
+
+            if synchronous is not None:
+                self._execute(f"PRAGMA synchronous = {synchronous}")
+
+        for pragma, value in pragmas.items():
+            self._execute(f"PRAGMA {pragma} = {value}")
+
         if transaction:
             self.sql("BEGIN")
 
@@ -176,7 +240,7 @@ class Database:
         *,
         columns: List[str] = [],
         where: str = "",
-        values: Dict[str, Any] = {},
+        values: Union[Dict[str, Any], Sequence[Any]] = (),
         limit: Optional[int] = None,
         offset: Optional[int] = None,
         order_by: Optional[Union[Tuple[str], str]] = None,
@@ -196,7 +260,8 @@ class Database:
             e.g., ``:placeholder`` in the SQL and then pass ``{"placeholder": x}`` as
             the ``values`` parameter.
         :param values: A dictionary of values to interpolate into the ``where``
-            argument.
+            argument, or a sequence of values if ``where`` uses positional ``?``
+            parameters instead.
         :param limit: An integer limit to the number of rows returned.
         :param offset: If not None, return results starting from this offset. Can be
             used in conjunction with ``limit`` for pagination.
@@ -210,6 +275,59 @@ class Database:
             columns will be retrieved. This parameter requires that ``Database`` was
             initialized with a ``schema`` parameter.
         """
+        sql = self._get_select_sql(
+            table,
+            columns=columns,
+            where=where,
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            descending=descending,
+            get_related=get_related,
+        )
+        return self.sql(sql, values)
+
+    def iter_select(
+        self,
+        table: str,
+        *,
+        columns: List[str] = [],
+        where: str = "",
+        values: Union[Dict[str, Any], Sequence[Any]] = (),
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[Union[Tuple[str], str]] = None,
+        descending: Optional[bool] = None,
+        get_related: Union[List[str], bool] = [],
+    ) -> Iterator[Row]:
+        """
+        Same as ``Database.select``, except that it returns an iterator over the rows
+        instead of a list. See ``Database.iter_sql`` for details.
+        """
+        sql = self._get_select_sql(
+            table,
+            columns=columns,
+            where=where,
+            limit=limit,
+            offset=offset,
+            order_by=order_by,
+            descending=descending,
+            get_related=get_related,
+        )
+        return self.iter_sql(sql, values)
+
+    def _get_select_sql(
+        self,
+        table: str,
+        *,
+        columns: List[str],
+        where: str,
+        limit: Optional[int],
+        offset: Optional[int],
+        order_by: Optional[Union[Tuple[str], str]],
+        descending: Optional[bool],
+        get_related: Union[List[str], bool],
+    ) -> str:
         if order_by:
             if isinstance(order_by, (tuple, list)):
                 order_by = ", ".join(map(quote, order_by))
@@ -244,10 +362,9 @@ class Database:
             selection, joins = self._get_related_columns_and_joins(
                 table, columns, get_related
             )
-            rows = self.sql(
+            return (
                 f"SELECT {selection} FROM {quote(table)} {joins} {where_clause}"
-                + f" {order_clause} {limit_clause}",
-                values,
+                + f" {order_clause} {limit_clause}"
             )
         else:
             if columns:
@@ -255,21 +372,18 @@ class Database:
             else:
                 selection = "*"
 
-            rows = self.sql(
+            return (
                 f"SELECT {selection} FROM {quote(table)} {where_clause} {order_clause}"
-                + f" {limit_clause}",
-                values,
+                + f" {limit_clause}"
             )
 
-        return rows
-
     def get(
         self,
         table: str,
         *,
         columns: List[str] = [],
         where: str = "",
-        values: Dict[str, Any] = {},
+        values: Union[Dict[str, Any], Sequence[Any]] = (),
         order_by: Optional[Union[Tuple[str], str]] = None,
         descending: Optional[bool] = None,
         get_related: Union[List[str], bool] = [],
@@ -292,17 +406,17 @@ class Database:
         :param descending: Same as for ``Database.select``.
         :param get_related: Same as for ``Database.select``.
         """
-        rows = self.select(
+        sql = self._get_select_sql(
             table,
             columns=columns,
             where=where,
-            values=values,
+            limit=1,
+            offset=None,
             order_by=order_by,
             descending=descending,
-            limit=1,
             get_related=get_related,
         )
-        return rows[0] if rows else None
+        return self._execute(sql, values).fetchone()
 
     def get_by_pk(
         self,
@@ -322,12 +436,16 @@ class Database:
         :param columns: Passed on to ``Database.get``.
         :param get_related: Passed on to ``Database.get``.
         """
+        if not columns and not get_related:
+            sql = self._get_pk_sql("SELECT *", table)
+            return self._execute(sql, (pk,)).fetchone()
+
         pk_column = f"{quote(table)}.rowid"
         return self.get(
             table,
             columns=columns,
-            where=f"{pk_column} = :pk",
-            values={"pk": pk},
+            where=f"{pk_column} = ?",
+            values=[pk],
             get_related=get_related,
         )
 
@@ -357,8 +475,8 @@ class Database:
                 "The `data` parameter to `get_or_insert` cannot be empty."
             )
 
-        query = " AND ".join(f"{key} = :{key}" for key in data)
-        row = self.get(table, where=query, values=data)
+        query = get_equality_where_clause(tuple(data.keys()))
+        row = self.get(table, where=query, values=list(data.values()))
         if row is None:
             row = self.insert_and_get(table, data, **kwargs)
             row.inserted = True  # type: ignore
@@ -372,7 +490,7 @@ class Database:
         table: str,
         *,
         where: str = "",
-        values: Dict[str, Any] = {},
+        values: Union[Dict[str, Any], Sequence[Any]] = (),
         distinct: str = "",
     ) -> int:
         """
@@ -387,13 +505,14 @@ class Database:
         """
         where_clause = f"WHERE {where}" if where else ""
         count_expression = "COUNT(*)" if not distinct else f"COUNT(DISTINCT {distinct})"
-        result = self.sql(
+        # An aggregate query always returns exactly one row, so unlike
+        # `sql(multiple=False)` there is no need to append LIMIT 1.
+        cursor = self._execute(
             f"SELECT {count_expression} FROM {quote(table)} {where_clause}",
             values,
             as_tuple=True,
-            multiple=False,
         )
-        return result[0]
+        return cursor.fetchone()[0]
 
     def insert(
         self,
@@ -424,29 +543,13 @@ class Database:
         else:
             auto_timestamp_columns_list = auto_timestamp_columns
 
-        keys = list(data.keys())
-        # Profiling revealed that constructing the placeholder string in this fashion
-        # is significantly faster than using ``join``.
-        placeholders = ("?," * len(keys))[:-1]
+        sql = self._get_insert_sql(
+            table, tuple(data.keys()), tuple(auto_timestamp_columns_list)
+        )
         values = list(data.values())
-
-        extra_columns_list = []
-        for column in auto_timestamp_columns_list:
-            keys.append(column)
-            extra_columns_list.append(self.current_timestamp_sql)
-
-        if extra_columns_list:
-            extra_columns = (", " if data else "") + ", ".join(extra_columns_list)
-        else:
-            extra_columns = ""
-
-        sql = f"""
-        INSERT INTO {quote(table)}({', '.join(map(quote, keys))})
-        VALUES ({placeholders}{extra_columns});
-        """
-        if self.debugger:
-            self.debugger.execute(sql, values)
-        self.cursor.execute(sql, values)
+        if auto_timestamp_columns_list and self.use_epoch_timestamps:
+            values.extend([int(time.time())] * len(auto_timestamp_columns_list))
+        self._execute(sql, values)
         return self.cursor.lastrowid
 
     def insert_and_get(
@@ -480,7 +583,7 @@ class Database:
     def insert_many(
         self,
         table: str,
-        data: Rows,
+        data: Iterable[Row],
         *,
         auto_timestamp_columns: Union[List[str], bool] = True,
     ) -> None:
@@ -493,8 +596,24 @@ class Database:
                 db.insert(table, row)
 
         but more efficient.
-        """
-        if not data:
+
+        If the database is not already in a transaction, the rows are inserted in a
+        transaction of their own, so either all of them are inserted or none are.
+
+        :param table: The database table. WARNING: This value is directly interpolated
+            into the SQL statement. Do not pass untrusted input, to avoid SQL injection
+            attacks.
+        :param data: The rows to insert, as dictionaries from column names to column
+            values. Every row must have the same keys as the first one, or else
+            ``ISqliteError`` is raised. Any iterable of rows is accepted, including a
+            generator, in which case the rows are never all held in memory at once.
+        :param auto_timestamp_columns: Same as for ``Database.insert``. With
+            ``use_epoch_timestamps``, every row gets the same timestamp.
+        """
+        rows = iter(data)
+        try:
+            first_row = next(rows)
+        except StopIteration:
             return
 
         if isinstance(auto_timestamp_columns, bool):
@@ -505,27 +624,17 @@ class Database:
         else:
             auto_timestamp_columns_list = auto_timestamp_columns
 
-        keys = list(data[0].keys())
-        placeholders = ",".join("?" for _ in range(len(keys)))
-
-        extra_columns_list = []
-        for column in auto_timestamp_columns_list:
-            keys.append(column)
-            extra_columns_list.append(self.current_timestamp_sql)
+        keys = tuple(first_row.keys())
+        sql = self._get_insert_sql(table, keys, tuple(auto_timestamp_columns_list))
 
-        if extra_columns_list:
-            extra_columns = (", " if data else "") + ", ".join(extra_columns_list)
-        else:
-            extra_columns = ""
+        values: Iterable[Tuple[Any, ...]] = map(
+            row_values_getter(keys), itertools.chain((first_row,), rows)
+        )
+        if auto_timestamp_columns_list and self.use_epoch_timestamps:
+            timestamps = (int(time.time()),) * len(auto_timestamp_columns_list)
+            values = (row_values + timestamps for row_values in values)
 
-        sql = f"""
-        INSERT INTO {quote(table)}({', '.join(map(quote, keys))})
-        VALUES ({placeholders}{extra_columns});
-        """
-        values = [tuple(d.values()) for d in data]
-        if self.debugger:
-            self.debugger.executemany(sql, values)
-        self.cursor.executemany(sql, values)
+        self._executemany_atomically(sql, values)
 
     def update(
         self,
@@ -533,7 +642,7 @@ class Database:
         data: Row,
         *,
         where: str = "",
-        values: Dict[str, Any] = {},
+        values: Union[Dict[str, Any], Sequence[Any]] = (),
         auto_timestamp_columns: Union[List[str], bool] = True,
     ) -> int:
         """
@@ -559,30 +668,38 @@ class Database:
         else:
             auto_timestamp_columns_list = auto_timestamp_columns
 
-        updates_list = []
-        for key, value in data.items():
-            if key in auto_timestamp_columns_list:
-                continue
-
-            placeholder = f"v{len(values)}"
-            values[placeholder] = value
-            updates_list.append(f"{quote(key)} = :{placeholder}")
-
-        for column in auto_timestamp_columns_list:
-            updates_list.append(f"{quote(column)} = {self.current_timestamp_sql}")
+        if auto_timestamp_columns_list:
+            keys = tuple(key for key in data if key not in auto_timestamp_columns_list)
+        else:
+            keys = tuple(data)
 
-        if not updates_list:
+        if not keys and not auto_timestamp_columns_list:
             raise ISqliteError(
                 "updates cannot be empty - either `data` or `auto_timestamp_columns` "
                 + "must be set"
             )
 
-        updates = ", ".join(updates_list)
-        where_clause = f"WHERE {where}" if where else ""
-        sql = f"UPDATE {quote(table)} SET {updates} {where_clause}"
-        if self.debugger:
-            self.debugger.execute(sql, values)
-        self.cursor.execute(sql, values)
+        update_values = [data[key] for key in keys]
+        if auto_timestamp_columns_list and self.use_epoch_timestamps:
+            update_values.extend([int(time.time())] * len(auto_timestamp_columns_list))
+
+        # sqlite3 does not allow named and positional parameters in the same statement,
+        # so the updated values are only bound by name if `where` uses named
+        # parameters.
+        if isinstance(values, dict) and values:
+            # Copy `values` so that the caller's dictionary is not modified.
+            values = dict(values)
+            first_placeholder: Optional[int] = len(values)
+            for i, value in enumerate(update_values, start=len(values)):
+                values[f"v{i}"] = value
+        else:
+            first_placeholder = None
+            values = update_values + list(values)
+
+        sql = self._get_update_sql(
+            table, keys, tuple(auto_timestamp_columns_list), where, first_placeholder
+        )
+        self._execute(sql, values)
         return self.cursor.rowcount
 
     def update_by_pk(self, table: str, pk: int, data: Row, **kwargs) -> bool:
@@ -601,15 +718,93 @@ class Database:
             self.update(
                 table,
                 data,
-                where=f"{pk_column} = :pk",
-                values={"pk": pk},
+                where=f"{pk_column} = ?",
+                values=[pk],
                 **kwargs,
             )
         )
 
-    def delete(self, table: str, *, where: str, values: Dict[str, Any] = {}) -> None:
+    def update_many_by_pks(
+        self,
+        table: str,
+        data: Iterable[Tuple[int, Row]],
+        *,
+        auto_timestamp_columns: Union[List[str], bool] = True,
+    ) -> int:
         """
-        Delete a set of rows.
+        Update multiple rows, each with its own values, and return the number of rows
+        updated.
+
+        Equivalent to::
+
+            for pk, row in data:
+                db.update_by_pk(table, pk, row)
+
+        but more efficient. Like ``Database.insert_many``, the rows are updated in a
+        transaction of their own if the database is not already in a transaction.
+
+        :param table: The database table. WARNING: This value is directly interpolated
+            into the SQL statement. Do not pass untrusted input, to avoid SQL injection
+            attacks.
+        :param data: Pairs of a primary key and the columns to update for that row, e.g.
+            ``rows.items()`` for a dictionary ``rows`` from primary keys to rows. Every
+            row must have the same keys as the first one, or else ``ISqliteError`` is
+            raised.
+        :param auto_timestamp_columns: Same as for ``Database.update``.
+        """
+        pairs = iter(data)
+        try:
+            first_pk, first_row = next(pairs)
+        except StopIteration:
+            return 0
+
+        if isinstance(auto_timestamp_columns, bool):
+            if auto_timestamp_columns is True:
+                auto_timestamp_columns_list = self.update_auto_timestamp_columns
+            else:
+                auto_timestamp_columns_list = []
+        else:
+            auto_timestamp_columns_list = auto_timestamp_columns
+
+        keys = tuple(key for key in first_row if key not in auto_timestamp_columns_list)
+        if not keys and not auto_timestamp_columns_list:
+            raise ISqliteError(
+                "updates cannot be empty - either `data` or `auto_timestamp_columns` "
+                + "must be set"
+            )
+
+        sql = self._get_update_sql(
+            table,
+            keys,
+            tuple(auto_timestamp_columns_list),
+            f"{quote(table)}.rowid = ?",
+            None,
+        )
+        if auto_timestamp_columns_list and self.use_epoch_timestamps:
+            timestamps: Tuple[Any, ...] = (int(time.time()),) * len(
+                auto_timestamp_columns_list
+            )
+        else:
+            timestamps = ()
+
+        # `keys` leaves out any auto-timestamp columns in the row, so the row's full
+        # length is passed for checking the other rows against.
+        getter = row_values_getter(keys, row_length=len(first_row))
+        values = (
+            getter(row) + timestamps + (pk,)
+            for pk, row in itertools.chain(((first_pk, first_row),), pairs)
+        )
+        return self._executemany_atomically(sql, values)
+
+    def delete(
+        self,
+        table: str,
+        *,
+        where: str,
+        values: Union[Dict[str, Any], Sequence[Any]] = (),
+    ) -> int:
+        """
+        Delete a set of rows and return the number of rows deleted.
 
         :param table: The database table. WARNING: This value is directly interpolated
             into the SQL statement. Do not pass untrusted input, to avoid SQL injection
@@ -624,7 +819,9 @@ class Database:
                 "The `where` argument to `delete` cannot be empty - to delete every row"
                 + 'in the table, pass `where="1"`'
             )
-        self.sql(f"DELETE FROM {quote(table)} WHERE {where}", values=values)
+        return self._execute(
+            f"DELETE FROM {quote(table)} WHERE {where}", values
+        ).rowcount
 
     def delete_by_pk(self, table: str, pk: int) -> None:
         """
@@ -635,12 +832,11 @@ class Database:
             attacks.
         :param pk: The primary key of the row to delete.
         """
-        pk_column = f"{quote(table)}.rowid"
-        return self.delete(table, where=f"{pk_column} = :pk", values={"pk": pk})
+        self._execute(self._get_pk_sql("DELETE", table), (pk,))
 
-    def delete_many_by_pks(self, table: str, pks: Sequence[int]) -> None:
+    def delete_many_by_pks(self, table: str, pks: Sequence[int]) -> int:
         """
-        Delete multiple rows.
+        Delete multiple rows and return the number of rows deleted.
 
         :param table: The database table. WARNING: This value is directly interpolated
             into the SQL statement. Do not pass untrusted input, to avoid SQL injection
@@ -649,16 +845,16 @@ class Database:
             empty, this method is a no-op.
         """
         if len(pks) == 0:
-            return
+            return 0
 
         pk_column = f"{quote(table)}.rowid"
         markers = ",".join("?" * len(pks))
-        return self.delete(table, where=f"{pk_column} IN ({markers})", values=pks)  # type: ignore
+        return self.delete(table, where=f"{pk_column} IN ({markers})", values=pks)
 
     def sql(
         self,
         query: str,
-        values: Dict[str, Any] = {},
+        values: Union[Dict[str, Any], Sequence[Any]] = (),
         *,
         as_tuple: bool = False,
         multiple: bool = True,
@@ -667,7 +863,8 @@ class Database:
         Execute a raw SQL query.
 
         :param query: The SQL query, as a string.
-        :param values: A dictionary of values to interpolate into the query.
+        :param values: A dictionary of values to interpolate into the query, or a
+            sequence of values if the query uses positional ``?`` parameters.
         :param as_tuple: If true, the rows are returned as tuples of values instead of
             ``OrderedDict`` objects. This is useful for aggregation queries, e.g.
             ``COUNT(*)``.
@@ -676,27 +873,43 @@ class Database:
             either be a tuple (if ``as_tuple=True``) or an ``OrderedDict`` object.
         """
         if multiple:
-            if self.debugger:
-                self.debugger.execute(query, values)
-            self.cursor.execute(query, values)
-            rows = self.cursor.fetchall()
-            if as_tuple:
-                return [tuple(row.values()) for row in rows]
-
-            return rows
+            cursor = self._execute(query, values, as_tuple=as_tuple)
+            return cursor.fetchall()
         else:
             query = query + " LIMIT 1"
-            if self.debugger:
-                self.debugger.execute(query, values)
-            self.cursor.execute(query, values)
-            row = self.cursor.fetchone()
-            if row is None:
-                return row
+            cursor = self._execute(query, values, as_tuple=as_tuple)
+            return cursor.fetchone()
+
+    def iter_sql(
+        self,
+        query: str,
+        values: Union[Dict[str, Any], Sequence[Any]] = (),
+        *,
+        as_tuple: bool = False,
+    ) -> Iterator[Any]:
+        """
+        Execute a raw SQL query and return an iterator over the resulting rows.
+
+        Unlike ``Database.sql``, the rows are fetched from SQLite one at a time as the
+        iterator is consumed, so the full result set is never held in memory at once.
+        The query is executed immediately, so any SQL errors are raised by this method
+        rather than by the iterator.
+
+        The query runs on its own cursor, so other methods may safely be called while
+        the iterator is being consumed.
 
-            if as_tuple:
-                return tuple(row.values())
+        :param query: Same as for ``Database.sql``.
+        :param values: Same as for ``Database.sql``.
+        :param as_tuple: Same as for ``Database.sql``.
+        """
+        cursor = self.connection.cursor()
+        if as_tuple:
+            cursor.row_factory = None
 
-            return row
+        if self.debugger:
+            self.debugger.execute(query, values)
+        cursor.execute(query, values)
+        return iterate_and_close(cursor)
 
     def create_table(self, table_name: str, columns: List[str]) -> None:
         """
@@ -771,7 +984,7 @@ class Database:
             will be raised.
         """
         table_schema = self.schema[table_name]
-        column_map = collections.OrderedDict((c.name, c) for c in table_schema.columns)
+        column_map = {c.name: c for c in table_schema.columns}
 
         if set(column_names) != set(column_map.keys()):
             raise ISqliteError(
@@ -1025,24 +1238,148 @@ class Database:
 
         self.close()
 
+    def _execute(
+        self, sql: str, values: Any = (), *, as_tuple: bool = False
+    ) -> sqlite3.Cursor:
+        if self.debugger:
+            self.debugger.execute(sql, values)
+
+        cursor = self._tuple_cursor if as_tuple else self.cursor
+        return cursor.execute(sql, values)
+
+    def _executemany(self, sql: str, values: Any) -> sqlite3.Cursor:
+        if self.debugger:
+            # `values` may be a one-shot iterator, so it has to be materialized before
+            # it can be both printed and executed.
+            values = list(values)
+            self.debugger.executemany(sql, values)
+        return self.cursor.executemany(sql, values)
+
+    def _executemany_atomically(self, sql: str, values: Any) -> int:
+        # Returns the cursor's row count, which must be read before the COMMIT statement
+        # resets it.
+        if self.in_transaction:
+            return self._executemany(sql, values).rowcount
+
+        # In autocommit mode, SQLite would commit (and sync to disk) after every row.
+        self.begin_transaction()
+        try:
+            rowcount = self._executemany(sql, values).rowcount
+        except BaseException:
+            self.rollback()
+            raise
+        else:
+            self.commit()
+            return rowcount
+
+    def _get_pk_sql(self, statement: str, table: str) -> str:
+        # `statement` is either "SELECT *" or "DELETE".
+        cache_key = (statement, table)
+        sql = self._pk_sql_cache.get(cache_key)
+        if sql is None:
+            sql = f"{statement} FROM {quote(table)} WHERE {quote(table)}.rowid = ?"
+            self._pk_sql_cache.put(cache_key, sql)
+        return sql
+
+    def _get_update_sql(
+        self,
+        table: str,
+        keys: Tuple[str, ...],
+        auto_timestamp_columns: Tuple[str, ...],
+        where: str,
+        first_placeholder: Optional[int],
+    ) -> str:
+        # `first_placeholder` is the index of the first named `:vN` parameter, or None
+        # if the statement uses positional parameters.
+        cache_key = (table, keys, auto_timestamp_columns, where, first_placeholder)
+        sql = self._update_sql_cache.get(cache_key)
+        if sql is not None:
+            return sql
+
+        # As in `_get_insert_sql`, epoch timestamps are bound as parameters.
+        if self.use_epoch_timestamps:
+            bound_columns = keys + auto_timestamp_columns
+        else:
+            bound_columns = keys
+
+        if first_placeholder is None:
+            updates_list = [f"{quote(column)} = ?" for column in bound_columns]
+        else:
+            updates_list = [
+                f"{quote(column)} = :v{i}"
+                for i, column in enumerate(bound_columns, start=first_placeholder)
+            ]
+
+        if not self.use_epoch_timestamps:
+            for column in auto_timestamp_columns:
+                updates_list.append(f"{quote(column)} = {self.current_timestamp_sql}")
+
+        updates = ", ".join(updates_list)
+        where_clause = f"WHERE {where}" if where else ""
+        sql = f"UPDATE {quote(table)} SET {updates} {where_clause}"
+        self._update_sql_cache.put(cache_key, sql)
+        return sql
+
+    def _get_insert_sql(
+        self, table: str, keys: Tuple[str, ...], auto_timestamp_columns: Tuple[str, ...]
+    ) -> str:
+        cache_key = (table, keys, auto_timestamp_columns)
+        sql = self._insert_sql_cache.get(cache_key)
+        if sql is not None:
+            return sql
+
+        # Profiling revealed that constructing the placeholder string in this fashion
+        # is significantly faster than using ``join``.
+        placeholders = ("?," * len(keys))[:-1]
+        if auto_timestamp_columns:
+            # Epoch timestamps are cheap to compute in Python, so they are bound as
+            # parameters (computed once per call) rather than being evaluated by SQLite
+            # for every row. ISO 8601 timestamps are faster to format in SQLite.
+            if self.use_epoch_timestamps:
+                timestamp = "?"
+            else:
+                timestamp = self.current_timestamp_sql
+
+            extra_columns = (", " if keys else "") + ", ".join(
+                timestamp for _ in auto_timestamp_columns
+            )
+        else:
+            extra_columns = ""
+
+        columns = ", ".join(map(quote, keys + auto_timestamp_columns))
+        sql = (
+            f"INSERT INTO {quote(table)}({columns}) "
+            + f"VALUES ({placeholders}{extra_columns})"
+        )
+        self._insert_sql_cache.put(cache_key, sql)
+        return sql
+
     def _migrate_table(self, name: str, columns: List[str], *, select: str) -> None:
         # This procedure is copied from https://sqlite.org/lang_altertable.html
+        #
+        # The statements are executed one by one rather than with `executescript`,
+        # because `executescript` commits any pending transaction first, which would
+        # break the atomicity of `apply_diff`. `_execute` is used instead of `sql`
+        # since none of these statements return rows that need fetching.
+
         # Create the new table under a temporary name.
         tmp_table_name = quote(f"isqlite_tmp_{name}")
-        self.sql(f"CREATE TABLE {tmp_table_name}({', '.join(columns)})")
+        self._execute(f"CREATE TABLE {tmp_table_name}({', '.join(columns)})")
 
         # Copy over all data from the old table into the new table using the
         # provided SELECT values.
-        self.sql(f"INSERT INTO {tmp_table_name} SELECT {select} FROM {quote(name)}")
+        self._execute(
+            f"INSERT INTO {tmp_table_name} SELECT {select} FROM {quote(name)}"
+        )
 
         # Drop the old table.
-        self.sql(f"DROP TABLE {quote(name)}")
+        self._execute(f"DROP TABLE {quote(name)}")
 
         # Rename the new table to the original name.
-        self.sql(f"ALTER TABLE {tmp_table_name} RENAME TO {quote(name)}")
+        self._execute(f"ALTER TABLE {tmp_table_name} RENAME TO {quote(name)}")
 
         # Check that no foreign key constraints have been violated.
-        self.sql("PRAGMA foreign_key_check")
+        self._execute("PRAGMA foreign_key_check")
 
     def _get_related_columns_and_joins(
         self,
@@ -1115,14 +1452,12 @@ class Database:
         return columns, joins
 
     def _get_schema_from_database(self) -> Schema:
-        return Schema(
-            [
-                sqliteparser.parse(row["sql"])[0]
-                for row in self.select(
-                    "sqlite_master", where="type = 'table' AND NOT name LIKE 'sqlite_%'"
-                )
-            ]
+        rows = self.sql(
+            "SELECT sql FROM sqlite_master "
+            + "WHERE type = 'table' AND NOT name LIKE 'sqlite_%'",
+            as_tuple=True,
         )
+        return Schema([parse_create_table_statement(sql) for (sql,) in rows])
 
 
 class TransactionContextManager:
@@ -1201,6 +1536,60 @@ def ordered_dict_row_factory(cursor: sqlite3.Cursor, row: Tuple[Any]) -> Row:
     return r
 
 
+def row_values_getter(
+    keys: Tuple[str, ...], *, row_length: Optional[int] = None
+) -> Callable[[Row], Tuple[Any, ...]]:
+    # `operator.itemgetter` extracts the values of each row in C and in the same order
+    # as `keys`, regardless of the order of the keys in each individual row. It only
+    # returns a tuple when given more than one key.
+    getter = operator.itemgetter(*keys) if keys else None
+    single = len(keys) == 1
+
+    # Every row must have exactly the keys of the first row. `itemgetter` raises an
+    # error for missing keys but silently ignores extra ones, so the number of keys is
+    # checked as well. `row_length` is the number of keys, including any that are not
+    # in `keys`.
+    expected_length = len(keys) if row_length is None else row_length
+
+    def get_row_values(row: Row) -> Tuple[Any, ...]:
+        if len(row) != expected_length:
+            raise ISqliteError("every row must have the same keys as the first row")
+
+        if getter is None:
+            return ()
+
+        try:
+            values = getter(row)
+        except KeyError:
+            raise ISqliteError(
+                "every row must have the same keys as the first row"
+            ) from None
+
+        return (values,) if single else values
+
+    return get_row_values
+
+
+def iterate_and_close(cursor: sqlite3.Cursor) -> Iterator[Any]:
+    try:
+        yield from cursor
+    finally:
+        cursor.close()
+
+
+@functools.lru_cache(maxsize=256)
+def parse_create_table_statement(sql: str) -> sqliteparser.ast.CreateTableStatement:
+    # The schema is re-read from the database after every migration, but most of the
+    # tables' CREATE TABLE statements will not have changed. The parsed statements are
+    # never mutated (renaming uses `attr.evolve`), so they are safe to share.
+    return sqliteparser.parse(sql)[0]
+
+
+@functools.lru_cache(maxsize=256)
+def get_equality_where_clause(keys: Tuple[str, ...]) -> str:
+    return " AND ".join(f"{quote(key)} = ?" for key in keys)
+
+
 def is_foreign_key_column(column: sqliteparser.ast.Column) -> bool:
     return any(
         isinstance(constraint, sqliteparser.ast.ForeignKeyConstraint)
@@ -1216,6 +1605,37 @@ def get_foreign_key_model(column: sqliteparser.ast.Column) -> Optional[str]:
     return None
 
 
+class LRUCache:
+    """
+    A small least-recently-used cache for generated SQL strings.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self._items: "collections.OrderedDict[Any, str]" = collections.OrderedDict()
+
+    def get(self, key: Any) -> Optional[str]:
+        try:
+            value = self._items[key]
+        except KeyError:
+            return None
+
+        self._items.move_to_end(key)
+        return value
+
+    def put(self, key: Any, value: str) -> None:
+        self._items[key] = value
+        self._items.move_to_end(key)
+        if len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
 class Debugger:
     def execute(self, sql: str, values: Any) -> None:
         self._execute("Execute", sql, values)
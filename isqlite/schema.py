@@ -1,4 +1,3 @@
-import collections
 from typing import Dict, List, Union
 
 import attr
@@ -26,7 +25,7 @@ class Table:
         self, name: str, columns: List[Union[str, sqliteparser.ast.Column]]
     ) -> None:
         self.name = name
-        self._columns = collections.OrderedDict()
+        self._columns = {}
 
         for column in columns:
             if isinstance(column, str):
@@ -102,7 +101,7 @@ class Schema:
     _tables: Dict[str, Table]
 
     def __init__(self, tables: List[Table]) -> None:
-        self._tables = collections.OrderedDict((table.name, table) for table in tables)
+        self._tables = {table.name: table for table in tables}
 
     def __getitem__(self, key: str) -> Table:
         try:
@@ -164,26 +163,28 @@ def diff_tables(old_table: Table, new_table: Table, *, detect_renaming=True) ->
     table_name = new_table.name
     diff: Diff = []
 
-    old_columns_to_index_map = {
-        column.name: i for i, column in enumerate(old_table.columns)
-    }
+    # `Table.columns` builds a new list on every access, so fetch the columns once.
+    old_columns = old_table.columns
+    new_columns = new_table.columns
+
+    old_columns_to_index_map = {column.name: i for i, column in enumerate(old_columns)}
     renamed_columns = set()
     reordered = False
-    for new_index, column in enumerate(new_table.columns):
+    for new_index, column in enumerate(new_columns):
         old_index = old_columns_to_index_map.get(column.name)
         if old_index is None:
             if (
                 # Renaming detection must be on...
                 detect_renaming
                 # ...the index must be valid in the old table...
-                and new_index < len(old_table.columns)
+                and new_index < len(old_columns)
                 # ...the column at the index in the old table must be gone...
-                and old_table.columns[new_index].name not in new_table
+                and old_columns[new_index].name not in new_table
                 # ...and the old and new columns at that index must otherwise
                 # correspond.
-                and is_renamed_column(column, old_table.columns[new_index])
+                and is_renamed_column(column, old_columns[new_index])
             ):
-                old_column_name = old_table.columns[new_index].name
+                old_column_name = old_columns[new_index].name
                 renamed_columns.add(old_column_name)
                 diff.append(
                     migrations.RenameColumnMigration(
@@ -197,7 +198,7 @@ def diff_tables(old_table: Table, new_table: Table, *, detect_renaming=True) ->
         if old_index != new_index:
             reordered = True
 
-        old_column = old_table.columns[old_index]
+        old_column = old_columns[old_index]
         if old_column != column:
             diff.append(
                 migrations.AlterColumnMigration(
@@ -205,11 +206,9 @@ def diff_tables(old_table: Table, new_table: Table, *, detect_renaming=True) ->
                 )
             )
 
-    new_columns_to_index_map = {
-        column.name: i for i, column in enumerate(new_table.columns)
-    }
+    new_columns_to_index_map = {column.name: i for i, column in enumerate(new_columns)}
     dropped_columns = set()
-    for column in old_table.columns:
+    for column in old_columns:
         if (
             column.name not in new_columns_to_index_map
             and column.name not in renamed_columns
@@ -218,11 +217,9 @@ def diff_tables(old_table: Table, new_table: Table, *, detect_renaming=True) ->
             diff.append(migrations.DropColumnMigration(table_name, column.name))
 
     if reordered:
-        reordered_columns = [column.name for column in new_table.columns]
+        reordered_columns = [column.name for column in new_columns]
         old_columns_except_dropped = [
-            column.name
-            for column in old_table.columns
-            if column.name not in dropped_columns
+            column.name for column in old_columns if column.name not in dropped_columns
         ]
         if reordered_columns != old_columns_except_dropped:
             diff.append(
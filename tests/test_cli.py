@@ -45,8 +45,10 @@ class TemporaryFileTestCase(unittest.TestCase):
                 ],
             )
 
-    def invoke(self, cli_function, args, *, exit_code=0):
-        result = self.runner.invoke(cli_function, args, catch_exceptions=False)
+    def invoke(self, cli_function, args, *, exit_code=0, input=None):
+        result = self.runner.invoke(
+            cli_function, args, input=input, catch_exceptions=False
+        )
 
         if exit_code is not None:
             self.assertEqual(
@@ -232,6 +234,51 @@ class OtherCommandsTests(TemporaryFileTestCase):
 
         self.assertEqual(output, "1\n")
 
+    def test_create_many(self):
+        self.create_table()
+
+        output = self.invoke(
+            cli.main_create_many,
+            [self.db_file_path, "books", "--no-auto-timestamp"],
+            input=(
+                'title="Blood Meridian" author="Cormac McCarthy"\n'
+                + "\n"
+                + "title=Emma author='Jane Austen'\n"
+                + "author=Anonymous title=Beowulf\n"
+            ),
+        )
+        self.assertEqual(output, "3 rows created.\n")
+
+        output = self.invoke(cli.main_select, [self.db_file_path, "books"])
+        self.assertEqual(
+            output,
+            S(
+                """
+            title           author
+            --------------  ---------------
+            Blood Meridian  Cormac McCarthy
+            Emma            Jane Austen
+            Beowulf         Anonymous
+
+            3 rows.
+            """
+            ),
+        )
+
+    def test_create_many_with_invalid_line(self):
+        self.create_table()
+
+        self.invoke(
+            cli.main_create_many,
+            [self.db_file_path, "books", "--no-auto-timestamp"],
+            input="title=Emma author='Jane Austen'\ntitle=Beowulf Anonymous\n",
+            exit_code=1,
+        )
+
+        # The rows before the invalid line are rolled back as well.
+        output = self.invoke(cli.main_select, [self.db_file_path, "books"])
+        self.assertEqual(output, "No row founds in table 'books'.\n")
+
     def test_delete(self):
         self.create_table(with_data=True)
 
@@ -240,6 +287,21 @@ class OtherCommandsTests(TemporaryFileTestCase):
         output = self.invoke(cli.main_select, [self.db_file_path, "books"])
         self.assertEqual(output, "No row founds in table 'books'.\n")
 
+    def test_delete_with_where(self):
+        self.create_table(with_data=True)
+
+        output = self.invoke(
+            cli.main_delete,
+            [
+                self.db_file_path,
+                "books",
+                "--where",
+                "author LIKE 'Cormac%'",
+                "--no-confirm",
+            ],
+        )
+        self.assertEqual(output, "\n1 row from table 'books' deleted.\n")
+
     def test_drop_column(self):
         self.create_table(with_data=True)
 
@@ -291,6 +353,221 @@ class OtherCommandsTests(TemporaryFileTestCase):
             ),
         )
 
+    def test_list_with_foreign_keys(self):
+        self.invoke(
+            cli.main_create_table,
+            [
+                self.db_file_path,
+                "authors",
+                "id INTEGER PRIMARY KEY",
+                "name TEXT NOT NULL",
+            ],
+        )
+        self.invoke(
+            cli.main_create_table,
+            [
+                self.db_file_path,
+                "books",
+                "title TEXT NOT NULL",
+                "author INTEGER REFERENCES authors",
+            ],
+        )
+        self.invoke(
+            cli.main_create,
+            [self.db_file_path, "authors", "--no-auto-timestamp", "name=Jane Austen"],
+        )
+        self.invoke(
+            cli.main_create_many,
+            [self.db_file_path, "books", "--no-auto-timestamp"],
+            input="title=Emma author=1\ntitle=Beowulf\n",
+        )
+
+        output = self.invoke(cli.main_list, [self.db_file_path, "books"])
+        self.assertEqual(
+            output,
+            S(
+                """
+            title    author
+            -------  ---------------
+            Emma     1 (Jane Austen)
+            Beowulf
+
+            2 rows.
+            """
+            ),
+        )
+
+        output = self.invoke(cli.main_get, [self.db_file_path, "books", "1"])
+        self.assertEqual(
+            output,
+            S(
+                """
+            ------  ---------------
+            title   Emma
+            author  1 (Jane Austen)
+            ------  ---------------
+            """
+            ),
+        )
+
+        output = self.invoke(cli.main_list, [self.db_file_path, "books", "--json"])
+        self.assertEqual(
+            output,
+            '{"title": "Emma", "author": {"id": 1, "name": "Jane Austen"}}\n'
+            + '{"title": "Beowulf", "author": null}\n',
+        )
+
+        output = self.invoke(
+            cli.main_get,
+            [self.db_file_path, "books", "1", "--json", "--plain-foreign-keys"],
+        )
+        self.assertEqual(output, '{"title": "Emma", "author": 1}\n')
+
+        # `name` is a column of the joined `authors` table, but here it only appears in
+        # a string literal, so the foreign key is still rendered.
+        output = self.invoke(
+            cli.main_list, [self.db_file_path, "books", "-w", "title != 'name'"]
+        )
+        self.assertIn("Emma     1 (Jane Austen)", output)
+
+        # `rowid` is ambiguous in the joined query, so the foreign key is not rendered.
+        output = self.invoke(
+            cli.main_list, [self.db_file_path, "books", "-w", "rowid = 1"]
+        )
+        self.assertEqual(
+            output,
+            S(
+                """
+            title      author
+            -------  --------
+            Emma            1
+
+            1 row.
+            """
+            ),
+        )
+
+    def test_list_as_tsv(self):
+        self.create_table(with_data=True)
+        self.invoke(
+            cli.main_create,
+            [
+                self.db_file_path,
+                "books",
+                "--no-auto-timestamp",
+                "title=Tab\tSeparated",
+                "author=Anon",
+            ],
+        )
+
+        output = self.invoke(cli.main_list, [self.db_file_path, "books", "--tsv"])
+        self.assertEqual(
+            output,
+            "title\tauthor\n"
+            + "Blood Meridian\tCormac McCarthy\n"
+            + "Tab\\tSeparated\tAnon\n",
+        )
+
+        output = self.invoke(
+            cli.main_sql,
+            [self.db_file_path, "SELECT author FROM books WHERE 0", "--tsv"],
+        )
+        self.assertEqual(output, "")
+
+    def test_search_with_foreign_keys(self):
+        self.create_books_and_authors()
+
+        # The search matches the rendered foreign key, "1 (Jane Austen)", whether or not
+        # --json is passed.
+        output = self.invoke(cli.main_search, [self.db_file_path, "books", "England"])
+        self.assertEqual(
+            output, "No rows found in table 'books' matching search query 'England'.\n"
+        )
+        output = self.invoke(
+            cli.main_search, [self.db_file_path, "books", "England", "--json"]
+        )
+        self.assertEqual(output, "")
+
+        output = self.invoke(cli.main_search, [self.db_file_path, "books", "1"])
+        self.assertIn("Emma     1 (Jane Austen)", output)
+        output = self.invoke(
+            cli.main_search, [self.db_file_path, "books", "1", "--json"]
+        )
+        self.assertEqual(
+            output,
+            '{"title": "Emma", "author": '
+            + '{"id": 1, "name": "Jane Austen", "country": "England"}}\n',
+        )
+
+    def test_list_as_json_with_ambiguous_where(self):
+        self.create_books_and_authors()
+
+        result = self.runner.invoke(
+            cli.main_list, [self.db_file_path, "books", "--json", "-w", "rowid = 1"]
+        )
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("--plain-foreign-keys", result.output)
+
+        output = self.invoke(
+            cli.main_list,
+            [self.db_file_path, "books", "--json", "-w", "books.rowid = 1"],
+        )
+        self.assertIn('"author": {"id": 1', output)
+
+        output = self.invoke(
+            cli.main_list,
+            [
+                self.db_file_path,
+                "books",
+                "--json",
+                "--plain-foreign-keys",
+                "-w",
+                "rowid = 1",
+            ],
+        )
+        self.assertEqual(output, '{"title": "Emma", "author": 1}\n')
+
+    def create_books_and_authors(self):
+        self.invoke(
+            cli.main_create_table,
+            [
+                self.db_file_path,
+                "authors",
+                "id INTEGER PRIMARY KEY",
+                "name TEXT NOT NULL",
+                "country TEXT NOT NULL",
+            ],
+        )
+        self.invoke(
+            cli.main_create_table,
+            [
+                self.db_file_path,
+                "books",
+                "title TEXT NOT NULL",
+                "author INTEGER REFERENCES authors",
+            ],
+        )
+        self.invoke(
+            cli.main_create,
+            [
+                self.db_file_path,
+                "authors",
+                "--no-auto-timestamp",
+                "name=Jane Austen",
+                "country=England",
+            ],
+        )
+        self.invoke(
+            cli.main_create,
+            [
+                self.db_file_path,
+                "books",
+                "--no-auto-timestamp",
+                "title=Emma",
+                "author=1",
+            ],
+        )
+
     def test_rename_column(self):
         self.create_table(with_data=True)
 
@@ -347,6 +624,17 @@ class OtherCommandsTests(TemporaryFileTestCase):
         output = self.invoke(cli.main_schema, [self.db_file_path])
         self.assertEqual(output, "books\n")
 
+        output = self.invoke(cli.main_schema, [self.db_file_path, "books"])
+        self.assertEqual(
+            output,
+            'CREATE TABLE "books"(\n'
+            + '"title"  TEXT NOT NULL,\n'
+            + '"author"  TEXT NOT NULL\n'
+            + ")\n",
+        )
+
+        self.invoke(cli.main_schema, [self.db_file_path, "authors"], exit_code=1)
+
     def test_search(self):
         self.create_table(with_data=True)
 
@@ -392,6 +680,41 @@ class OtherCommandsTests(TemporaryFileTestCase):
             ),
         )
 
+    def test_update_many(self):
+        self.create_table(with_data=True)
+        self.invoke(
+            cli.main_create,
+            [
+                self.db_file_path,
+                "books",
+                "--no-auto-timestamp",
+                "title=Emma",
+                "author=Jane Austen",
+            ],
+        )
+
+        output = self.invoke(
+            cli.main_update_many,
+            [self.db_file_path, "books", "--no-auto-timestamp"],
+            input="1 author='C. McCarthy'\n2 author=J.Austen\n3 author=Nobody\n",
+        )
+        self.assertEqual(output, "2 rows updated.\n")
+
+        output = self.invoke(cli.main_select, [self.db_file_path, "books"])
+        self.assertEqual(
+            output,
+            S(
+                """
+            title           author
+            --------------  -----------
+            Blood Meridian  C. McCarthy
+            Emma            J.Austen
+
+            2 rows.
+            """
+            ),
+        )
+
     def test_update_with_equals_sign_in_value(self):
         self.create_table(with_data=True)
 
@@ -420,6 +743,15 @@ class OtherCommandsTests(TemporaryFileTestCase):
             ),
         )
 
+    def test_create_with_missing_equals_sign(self):
+        self.create_table()
+
+        result = self.runner.invoke(
+            cli.main_create, [self.db_file_path, "books", "title=Emma", "Jane Austen"]
+        )
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("KEY=VALUE, not 'Jane Austen'", result.output)
+
     def test_create_with_equals_sign_in_value(self):
         self.create_table()
 
@@ -1,5 +1,8 @@
+import datetime
 import decimal
+import os
 import sqlite3
+import tempfile
 import time
 import unittest
 
@@ -74,7 +77,7 @@ class DatabaseTests(unittest.TestCase):
                     "credits": decimal.Decimal(2.0),
                 },
                 {
-                    "couse_number": 101,
+                    "course_number": 101,
                     "department": ling_department_pk,
                     "instructor": noam_chomsky["id"],
                     "title": "Intro to Linguistics",
@@ -142,6 +145,44 @@ class DatabaseTests(unittest.TestCase):
             0,
         )
 
+    def test_sql_as_tuple(self):
+        rows = self.db.sql(
+            "SELECT name, abbreviation FROM departments ORDER BY name", as_tuple=True
+        )
+        self.assertEqual(rows, [("Computer Science", "CS"), ("Linguistics", "LING")])
+
+        row = self.db.sql(
+            "SELECT name FROM departments WHERE abbreviation = :abbreviation",
+            {"abbreviation": "LING"},
+            as_tuple=True,
+            multiple=False,
+        )
+        self.assertEqual(row, ("Linguistics",))
+
+        # Rows should still be returned as dictionaries when `as_tuple` is not passed.
+        row = self.db.sql("SELECT name FROM departments", multiple=False)
+        self.assertEqual(list(row.keys()), ["name"])
+
+    def test_iter_sql(self):
+        rows = self.db.iter_sql(
+            "SELECT name FROM departments ORDER BY name", as_tuple=True
+        )
+        self.assertEqual(next(rows), ("Computer Science",))
+
+        # Other queries can be run while the iterator is only partially consumed.
+        self.assertEqual(self.db.count("departments"), 2)
+
+        self.assertEqual(list(rows), [("Linguistics",)])
+
+        rows = self.db.iter_sql(
+            "SELECT name FROM departments WHERE abbreviation = :abbreviation",
+            {"abbreviation": "CS"},
+        )
+        self.assertEqual([row["name"] for row in rows], ["Computer Science"])
+
+        with self.assertRaises(sqlite3.OperationalError):
+            self.db.iter_sql("SELECT * FROM deans")
+
     def test_get(self):
         professor = self.db.get(
             "professors", where="last_name = :last_name", values={"last_name": "Knuth"}
@@ -265,6 +306,15 @@ class DatabaseTests(unittest.TestCase):
 
         self.assertEqual(self.db.count("students"), n + 1)
 
+    def test_get_or_insert_with_keyword_column_name(self):
+        with Database(":memory:", transaction=False) as db:
+            db.create_table("t", ['"order" INTEGER'])
+            row = db.get_or_insert("t", {"order": 1})
+            self.assertTrue(row.inserted)
+            row = db.get_or_insert("t", {"order": 1})
+            self.assertFalse(row.inserted)
+            self.assertEqual(db.count("t"), 1)
+
     def test_update_with_pk(self):
         professor = self.db.get("professors", where="last_name = 'Knuth'")
         self.assertFalse(professor["retired"])
@@ -289,6 +339,66 @@ class DatabaseTests(unittest.TestCase):
         self.assertEqual(n, 3)
         self.assertEqual(self.db.count("students", where="graduation_year > 2025"), 3)
 
+    def test_update_with_positional_values(self):
+        n = self.db.update(
+            "students",
+            {"graduation_year": 2026},
+            where="graduation_year < ?",
+            values=[2025],
+        )
+
+        self.assertEqual(n, 3)
+        self.assertEqual(self.db.count("students", where="graduation_year > 2025"), 3)
+
+        n = self.db.update(
+            "students",
+            {"graduation_year": 2027},
+            where="graduation_year = :year",
+            values={"year": 2026},
+        )
+
+        self.assertEqual(n, 3)
+        self.assertEqual(self.db.count("students", where="graduation_year > 2026"), 3)
+
+    def test_update_many_by_pks(self):
+        professors = self.db.select("professors", order_by="id")
+        n = self.db.update_many_by_pks(
+            "professors",
+            [
+                (professors[0]["id"], {"first_name": "A", "retired": True}),
+                (professors[1]["id"], {"retired": False, "first_name": "B"}),
+            ],
+        )
+
+        self.assertEqual(n, 2)
+        professor = self.db.get_by_pk("professors", professors[0]["id"])
+        self.assertEqual(professor["first_name"], "A")
+        self.assertTrue(professor["retired"])
+        professor = self.db.get_by_pk("professors", professors[1]["id"])
+        self.assertEqual(professor["first_name"], "B")
+        self.assertFalse(professor["retired"])
+
+        self.assertEqual(self.db.update_many_by_pks("professors", []), 0)
+
+        with self.assertRaises(ISqliteError):
+            self.db.update_many_by_pks(
+                "professors",
+                [
+                    (professors[0]["id"], {"first_name": "C"}),
+                    (professors[1]["id"], {"first_name": "D", "retired": True}),
+                ],
+            )
+
+    def test_update_does_not_modify_values(self):
+        values = {"year": 2025}
+        self.db.update(
+            "students",
+            {"graduation_year": 2026},
+            where="graduation_year < :year",
+            values=values,
+        )
+        self.assertEqual(values, {"year": 2025})
+
     def test_update_with_full_object(self):
         professor = self.db.get("professors", where="last_name = 'Knuth'")
         self.assertFalse(professor["retired"])
@@ -320,7 +430,8 @@ class DatabaseTests(unittest.TestCase):
             )
 
     def test_delete(self):
-        self.db.delete("students", where="graduation_year > 2022")
+        n = self.db.delete("students", where="graduation_year > 2022")
+        self.assertEqual(n, 2)
         student = self.db.get("students", where="graduation_year > 2022")
         self.assertIsNone(student)
 
@@ -338,8 +449,9 @@ class DatabaseTests(unittest.TestCase):
         # Make sure we are in fact deleting multiple rows.
         self.assertGreater(len(student_ids), 1)
 
-        self.db.delete_many_by_pks("students", student_ids)
+        n = self.db.delete_many_by_pks("students", student_ids)
 
+        self.assertEqual(n, len(student_ids))
         self.assertEqual(self.db.count("students"), 1)
         self.assertIsNotNone(self.db.get_by_pk("students", one_not_to_delete))
         self.assertIsNone(self.db.get_by_pk("students", student_ids[0]))
@@ -351,6 +463,53 @@ class DatabaseTests(unittest.TestCase):
 
         self.assertEqual(count_before, count_after)
 
+    def test_insert_many_outside_transaction(self):
+        schema = Schema([Table("t", [columns.text("name", unique=True)])])
+        with Database(":memory:", transaction=False) as db:
+            db.migrate(schema)
+            db.insert_many("t", [{"name": "a"}, {"name": "b"}])
+            self.assertFalse(db.in_transaction)
+            self.assertEqual(db.count("t"), 2)
+
+            with self.assertRaises(sqlite3.IntegrityError):
+                db.insert_many("t", [{"name": "c"}, {"name": "a"}])
+
+            self.assertFalse(db.in_transaction)
+            self.assertEqual(db.count("t"), 2)
+
+    def test_insert_many_with_different_key_order(self):
+        self.db.insert_many(
+            "departments",
+            (
+                (
+                    {"name": name, "abbreviation": abbreviation}
+                    if i % 2 == 0
+                    else {"abbreviation": abbreviation, "name": name}
+                )
+                for i, (name, abbreviation) in enumerate(
+                    [("Mathematics", "MATH"), ("Philosophy", "PHIL")]
+                )
+            ),
+        )
+
+        department = self.db.get("departments", where="name = 'Philosophy'")
+        self.assertEqual(department["abbreviation"], "PHIL")
+
+    def test_insert_many_with_different_keys(self):
+        for extra_row in [
+            # Extra key
+            {"name": "Philosophy", "abbreviation": "PHIL", "code": 1},
+            # Missing key
+            {"name": "Philosophy"},
+            # Different key
+            {"name": "Philosophy", "code": 1},
+        ]:
+            with self.assertRaises(ISqliteError):
+                self.db.insert_many(
+                    "departments",
+                    [{"name": "Mathematics", "abbreviation": "MATH"}, extra_row],
+                )
+
     def test_select(self):
         for i in range(100):
             self.db.insert(
@@ -372,6 +531,25 @@ class DatabaseTests(unittest.TestCase):
 
         self.assertEqual(len(self.db.select("students", limit=5)), 5)
 
+    def test_iter_select(self):
+        rows = self.db.iter_select(
+            "students", where="graduation_year < :year", values={"year": 2025}
+        )
+        self.assertNotIsInstance(rows, list)
+        self.assertEqual(
+            list(rows),
+            self.db.select(
+                "students", where="graduation_year < :year", values={"year": 2025}
+            ),
+        )
+
+        rows = self.db.iter_select(
+            "courses", where="course_number = 399", get_related=["department"]
+        )
+        row = next(rows)
+        self.assertEqual(row["department"]["name"], "Computer Science")
+        self.assertEqual(list(rows), [])
+
     def test_select_with_certain_columns(self):
         for i in range(100):
             self.db.insert(
@@ -648,3 +826,103 @@ class DatabaseTests(unittest.TestCase):
             self.assertGreater(row["last_updated_at"], current_time - 60)
             self.assertLess(row["last_updated_at"], current_time + 60)
             self.assertEqual(row["created_at"], row["last_updated_at"])
+
+    def test_insert_many_with_auto_epoch_timestamps(self):
+        current_time = int(time.time())
+        schema = Schema([AutoTable("t", [], use_epoch_timestamps=True)])
+        with Database(
+            ":memory:",
+            transaction=False,
+            insert_auto_timestamp_columns=["created_at", "last_updated_at"],
+            use_epoch_timestamps=True,
+        ) as db:
+            db.migrate(schema)
+            db.insert_many("t", [{}, {}])
+
+            rows = db.select("t")
+            self.assertEqual(len(rows), 2)
+            for row in rows:
+                self.assertGreater(row["created_at"], current_time - 60)
+                self.assertLess(row["created_at"], current_time + 60)
+                self.assertEqual(row["created_at"], row["last_updated_at"])
+
+    def test_update_with_auto_epoch_timestamps(self):
+        schema = Schema(
+            [AutoTable("t", [columns.integer("n")], use_epoch_timestamps=True)]
+        )
+        with Database(
+            ":memory:",
+            transaction=False,
+            insert_auto_timestamp_columns=["created_at", "last_updated_at"],
+            update_auto_timestamp_columns=["last_updated_at"],
+            use_epoch_timestamps=True,
+        ) as db:
+            db.migrate(schema)
+            pk1 = db.insert("t", {"n": 1})
+            pk2 = db.insert("t", {"n": 2})
+            db.sql("UPDATE t SET last_updated_at = 0")
+
+            db.update("t", {"n": 3}, where="n = :n", values={"n": 1})
+            db.update_by_pk("t", pk2, {"n": 4})
+            self.assertEqual(db.count("t", where="last_updated_at = 0"), 0)
+            self.assertEqual([row["n"] for row in db.select("t")], [3, 4])
+
+            db.sql("UPDATE t SET last_updated_at = 0")
+            db.update_many_by_pks("t", [(pk1, {"n": 5}), (pk2, {"n": 6})])
+            self.assertEqual(db.count("t", where="last_updated_at = 0"), 0)
+            self.assertEqual([row["n"] for row in db.select("t")], [5, 6])
+
+    def test_insert_with_different_columns(self):
+        # Inserts into the same table with different sets of columns must not share a
+        # cached INSERT statement.
+        with Database(":memory:", transaction=False, cached_statements=1) as db:
+            db.create_table("t", ["a INTEGER", "b INTEGER"])
+            db.insert("t", {"a": 1})
+            db.insert("t", {"b": 2})
+            db.insert("t", {"b": 3, "a": 4})
+            db.insert("t", {"a": 5})
+
+            self.assertEqual(
+                [tuple(row.values()) for row in db.select("t")],
+                [(1, None), (None, 2), (4, 3), (5, None)],
+            )
+
+    def test_update_with_different_columns(self):
+        with Database(":memory:", transaction=False, cached_statements=1) as db:
+            db.create_table("t", ["a INTEGER", "b INTEGER"])
+            pk = db.insert("t", {"a": 1, "b": 2})
+            db.update_by_pk("t", pk, {"a": 3})
+            db.update_by_pk("t", pk, {"b": 4})
+            db.update("t", {"b": 5, "a": 6}, where="a = :a", values={"a": 3})
+
+            row = db.get_by_pk("t", pk)
+            self.assertEqual((row["a"], row["b"]), (6, 5))
+
+    def test_pragmas(self):
+        with Database(
+            ":memory:", pragmas={"cache_size": -4000, "temp_store": "MEMORY"}
+        ) as db:
+            self.assertEqual(db.sql("PRAGMA cache_size", as_tuple=True), [(-4000,)])
+            # 2 is the numeric value for MEMORY.
+            self.assertEqual(db.sql("PRAGMA temp_store", as_tuple=True), [(2,)])
+
+    def test_journal_mode_and_synchronous(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "db.sqlite3")
+            with Database(path, journal_mode="WAL", synchronous="NORMAL") as db:
+                self.assertEqual(
+                    db.sql("PRAGMA journal_mode", as_tuple=True), [("wal",)]
+                )
+                # 1 is the numeric value for NORMAL.
+                self.assertEqual(db.sql("PRAGMA synchronous", as_tuple=True), [(1,)])
+
+    def test_time_column(self):
+        with Database(":memory:", transaction=False) as db:
+            db.create_table("t", [columns.time("t", required=False)])
+            db.insert("t", {"t": datetime.time(9, 5, 30)})
+            db.sql("INSERT INTO t(t) VALUES ('13:45')")
+
+            self.assertEqual(
+                [row["t"] for row in db.select("t")],
+                [datetime.time(9, 5, 30), datetime.time(13, 45)],
+            )
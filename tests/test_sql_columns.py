@@ -123,3 +123,22 @@ class ColumnToSqlTests(unittest.TestCase):
                 ),
             ),
         )
+
+    def test_columns_do_not_share_constraints(self):
+        self.assertEqual(
+            columns.date("started", required=False, unique=True),
+            ast.Column(
+                name="started",
+                definition=ast.ColumnDefinition(
+                    type="DATE", constraints=[ast.UniqueConstraint()]
+                ),
+            ),
+        )
+
+        self.assertEqual(
+            columns.date("finished", required=False),
+            ast.Column(
+                name="finished",
+                definition=ast.ColumnDefinition(type="DATE", constraints=[]),
+            ),
+        )